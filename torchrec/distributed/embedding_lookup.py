@@ -68,37 +68,44 @@ def _load_state_dict(
     state_dict: "OrderedDict[str, Union[torch.Tensor, ShardedTensor]]",
 ) -> Tuple[List[str], List[str]]:
     missing_keys = []
-    unexpected_keys = list(state_dict.keys())
+    loaded_keys = set()
+    # accumulate all module params into one destination instead of building an
+    # intermediate state_dict per module
+    dst_state_dict: "OrderedDict[str, Union[torch.Tensor, ShardedTensor]]" = (
+        OrderedDict()
+    )
     for emb_module in emb_modules:
-        for key, dst_param in emb_module.state_dict().items():
-            if key in state_dict:
-                src_param = state_dict[key]
-                if isinstance(dst_param, ShardedTensor):
-                    assert isinstance(src_param, ShardedTensor)
-                    assert len(dst_param.local_shards()) == len(
-                        src_param.local_shards()
+        emb_module.state_dict(dst_state_dict, "", True)
+
+    for key, dst_param in dst_state_dict.items():
+        if key in state_dict:
+            src_param = state_dict[key]
+            if isinstance(dst_param, ShardedTensor):
+                assert isinstance(src_param, ShardedTensor)
+                assert len(dst_param.local_shards()) == len(src_param.local_shards())
+                for dst_local_shard, src_local_shard in zip(
+                    dst_param.local_shards(), src_param.local_shards()
+                ):
+                    assert (
+                        dst_local_shard.metadata.shard_offsets
+                        == src_local_shard.metadata.shard_offsets
                     )
-                    for dst_local_shard, src_local_shard in zip(
-                        dst_param.local_shards(), src_param.local_shards()
-                    ):
-                        assert (
-                            dst_local_shard.metadata.shard_offsets
-                            == src_local_shard.metadata.shard_offsets
-                        )
-                        assert (
-                            dst_local_shard.metadata.shard_sizes
-                            == src_local_shard.metadata.shard_sizes
-                        )
-
-                        dst_local_shard.tensor.detach().copy_(src_local_shard.tensor)
-                else:
-                    assert isinstance(src_param, torch.Tensor) and isinstance(
-                        dst_param, torch.Tensor
+                    assert (
+                        dst_local_shard.metadata.shard_sizes
+                        == src_local_shard.metadata.shard_sizes
                     )
-                    dst_param.detach().copy_(src_param)
-                unexpected_keys.remove(key)
+
+                    dst_local_shard.tensor.detach().copy_(src_local_shard.tensor)
             else:
-                missing_keys.append(cast(str, key))
+                assert isinstance(src_param, torch.Tensor) and isinstance(
+                    dst_param, torch.Tensor
+                )
+                dst_param.detach().copy_(src_param)
+            loaded_keys.add(key)
+        else:
+            missing_keys.append(cast(str, key))
+    # single pass over state_dict instead of a list.remove per loaded key
+    unexpected_keys = [key for key in state_dict.keys() if key not in loaded_keys]
     return missing_keys, unexpected_keys
 
 
@@ -173,6 +180,9 @@ class GroupedEmbeddingsLookup(BaseEmbeddingLookup[KeyedJaggedTensor, torch.Tenso
         self._need_prefetch: bool = False
         for config in grouped_configs:
             self._emb_modules.append(_create_lookup(config))
+        # plain list view for hot-path iteration, modules stay registered through
+        # self._emb_modules
+        self._emb_modules_list: List[nn.Module] = list(self._emb_modules)
 
         self._feature_splits: List[int] = []
         for config in grouped_configs:
@@ -203,7 +213,7 @@ class GroupedEmbeddingsLookup(BaseEmbeddingLookup[KeyedJaggedTensor, torch.Tenso
             features_by_group = sparse_features.split(
                 self._feature_splits,
             )
-            for emb_op, features in zip(self._emb_modules, features_by_group):
+            for emb_op, features in zip(self._emb_modules_list, features_by_group):
                 if (
                     isinstance(emb_op.emb_module, SplitTableBatchedEmbeddingBagsCodegen)
                     and not emb_op.emb_module.prefetch_pipeline
@@ -224,13 +234,21 @@ class GroupedEmbeddingsLookup(BaseEmbeddingLookup[KeyedJaggedTensor, torch.Tenso
         sparse_features: KeyedJaggedTensor,
     ) -> torch.Tensor:
         embeddings: List[torch.Tensor] = []
-        features_by_group = sparse_features.split(
-            self._feature_splits,
+        features_by_group = (
+            [sparse_features]
+            if len(self._feature_splits) == 1
+            else sparse_features.split(
+                self._feature_splits,
+            )
         )
-        for emb_op, features in zip(self._emb_modules, features_by_group):
-            embeddings.append(emb_op(features).view(-1))
+        for emb_op, features in zip(self._emb_modules_list, features_by_group):
+            embeddings.append(emb_op(features))
 
-        return embeddings_cat_empty_rank_handle(embeddings, self._dummy_embs_tensor)
+        # all groups share the same embedding dim, so concat the 2d outputs and
+        # flatten once instead of flattening each group's output
+        return embeddings_cat_empty_rank_handle(
+            embeddings, self._dummy_embs_tensor
+        ).view(-1)
 
     # pyre-fixme[14]: `state_dict` overrides method defined in `Module` inconsistently.
     def state_dict(
@@ -368,6 +386,9 @@ class GroupedPooledEmbeddingsLookup(
         self._emb_modules: nn.ModuleList = nn.ModuleList()
         for config in grouped_configs:
             self._emb_modules.append(_create_lookup(config, device))
+        # plain list view for hot-path iteration, modules stay registered through
+        # self._emb_modules
+        self._emb_modules_list: List[nn.Module] = list(self._emb_modules)
 
         self._feature_splits: List[int] = []
         for config in grouped_configs:
@@ -393,24 +414,33 @@ class GroupedPooledEmbeddingsLookup(
             else 1
         )
 
-    def prefetch(
-        self,
-        sparse_features: KeyedJaggedTensor,
-        forward_stream: Optional[torch.cuda.Stream] = None,
-    ) -> None:
         def _need_prefetch(config: GroupedEmbeddingConfig) -> bool:
             for table in config.embedding_tables:
                 if table.compute_kernel == EmbeddingComputeKernel.FUSED_UVM_CACHING:
                     return True
             return False
 
+        self._need_prefetch_mask: List[bool] = [
+            _need_prefetch(config) for config in grouped_configs
+        ]
+        self._need_prefetch: bool = any(self._need_prefetch_mask)
+
+    def prefetch(
+        self,
+        sparse_features: KeyedJaggedTensor,
+        forward_stream: Optional[torch.cuda.Stream] = None,
+    ) -> None:
+        if not self._need_prefetch:
+            return
         if len(self._emb_modules) > 0:
             assert sparse_features is not None
             features_by_group = sparse_features.split(
                 self._feature_splits,
             )
-            for emb_op, features in zip(self._emb_modules, features_by_group):
-                if not _need_prefetch(emb_op.config):
+            for need_prefetch, emb_op, features in zip(
+                self._need_prefetch_mask, self._emb_modules_list, features_by_group
+            ):
+                if not need_prefetch:
                     continue
                 if (
                     isinstance(emb_op.emb_module, SplitTableBatchedEmbeddingBagsCodegen)
@@ -434,11 +464,22 @@ class GroupedPooledEmbeddingsLookup(
         embeddings: List[torch.Tensor] = []
         if len(self._emb_modules) > 0:
             assert sparse_features is not None
-            features_by_group = sparse_features.split(
-                self._feature_splits,
+            # a single group can read the input KJT as is, unless its weights
+            # get gradient scaling below, which writes to the KJT; split then
+            # still hands out a fresh KJT so the caller's input is left intact
+            features_by_group = (
+                [sparse_features]
+                if len(self._feature_splits) == 1
+                and not (
+                    self.grouped_configs[0].is_weighted
+                    and self._scale_gradient_factor != 1
+                )
+                else sparse_features.split(
+                    self._feature_splits,
+                )
             )
             for config, emb_op, features in zip(
-                self.grouped_configs, self._emb_modules, features_by_group
+                self.grouped_configs, self._emb_modules_list, features_by_group
             ):
                 if (
                     config.has_feature_processor
@@ -447,7 +488,8 @@ class GroupedPooledEmbeddingsLookup(
                 ):
                     features = self._feature_processor(features)
 
-                if config.is_weighted:
+                # scaling by a factor of 1 is a no-op, skip the autograd node
+                if config.is_weighted and self._scale_gradient_factor != 1:
                     features._weights = CommOpGradientScaling.apply(
                         features._weights, self._scale_gradient_factor
                     )
@@ -818,11 +860,34 @@ class MetaInferGroupedPooledEmbeddingsLookup(
         pass
 
 
+def _get_rank_devices(
+    device: Optional[torch.device], world_size: int
+) -> List[torch.device]:
+    device_type = "meta" if device is not None and device.type == "meta" else "cuda"
+    # syntax for torchscript
+    return [torch.device(type=device_type, index=rank) for rank in range(world_size)]
+
+
 class InferGroupedLookupMixin(ABC):
+    def _get_flat_emb_modules(self) -> List[nn.Module]:
+        # per-rank group modules flattened once so that state_dict and
+        # parameter/buffer traversal do not walk the rank -> group structure
+        return [
+            emb_module
+            # pyre-fixme[16]
+            for lookup in self._embedding_lookups_per_rank
+            for emb_module in lookup._emb_modules
+        ]
+
     def forward(
         self,
         sparse_features: KJTList,
     ) -> List[torch.Tensor]:
+        # pyre-fixme[16]
+        if len(self._embedding_lookups_per_rank) == 1:
+            # single rank (e.g. single gpu serving), skip per-rank indirection
+            return [self._embedding_lookups_per_rank[0].forward(sparse_features[0])]
+
         embeddings: List[torch.Tensor] = []
         # syntax for torchscript
         for i, embedding_lookup in enumerate(
@@ -845,8 +910,8 @@ class InferGroupedLookupMixin(ABC):
             destination._metadata = OrderedDict()
 
         # pyre-fixme[16]
-        for rank_modules in self._embedding_lookups_per_rank:
-            rank_modules.state_dict(destination, prefix, keep_vars)
+        for emb_module in self._flat_emb_modules:
+            emb_module.state_dict(destination, prefix, keep_vars)
 
         return destination
 
@@ -870,15 +935,15 @@ class InferGroupedLookupMixin(ABC):
         self, prefix: str = "", recurse: bool = True
     ) -> Iterator[Tuple[str, nn.Parameter]]:
         # pyre-fixme[16]
-        for rank_modules in self._embedding_lookups_per_rank:
-            yield from rank_modules.named_parameters(prefix, recurse)
+        for emb_module in self._flat_emb_modules:
+            yield from emb_module.named_parameters(prefix, recurse)
 
     def named_buffers(
         self, prefix: str = "", recurse: bool = True
     ) -> Iterator[Tuple[str, torch.Tensor]]:
         # pyre-fixme[16]
-        for rank_modules in self._embedding_lookups_per_rank:
-            yield from rank_modules.named_buffers(prefix, recurse)
+        for emb_module in self._flat_emb_modules:
+            yield from emb_module.named_buffers(prefix, recurse)
 
 
 class InferGroupedPooledEmbeddingsLookup(
@@ -898,17 +963,16 @@ class InferGroupedPooledEmbeddingsLookup(
             MetaInferGroupedPooledEmbeddingsLookup
         ] = []
 
-        device_type = "meta" if device is not None and device.type == "meta" else "cuda"
-        for rank in range(world_size):
+        for rank, rank_device in enumerate(_get_rank_devices(device, world_size)):
             self._embedding_lookups_per_rank.append(
                 # TODO add position weighted module support
                 MetaInferGroupedPooledEmbeddingsLookup(
                     grouped_configs=grouped_configs_per_rank[rank],
-                    # syntax for torchscript
-                    device=torch.device(type=device_type, index=rank),
+                    device=rank_device,
                     fused_params=fused_params,
                 )
             )
+        self._flat_emb_modules: List[nn.Module] = self._get_flat_emb_modules()
 
     def get_tbes_to_register(
         self,
@@ -931,16 +995,15 @@ class InferGroupedEmbeddingsLookup(
         super().__init__()
         self._embedding_lookups_per_rank: List[MetaInferGroupedEmbeddingsLookup] = []
 
-        device_type = "meta" if device is not None and device.type == "meta" else "cuda"
-        for rank in range(world_size):
+        for rank, rank_device in enumerate(_get_rank_devices(device, world_size)):
             self._embedding_lookups_per_rank.append(
                 MetaInferGroupedEmbeddingsLookup(
                     grouped_configs=grouped_configs_per_rank[rank],
-                    # syntax for torchscript
-                    device=torch.device(type=device_type, index=rank),
+                    device=rank_device,
                     fused_params=fused_params,
                 )
             )
+        self._flat_emb_modules: List[nn.Module] = self._get_flat_emb_modules()
 
     def get_tbes_to_register(
         self,
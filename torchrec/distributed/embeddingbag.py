@@ -7,8 +7,7 @@
 
 # pyre-strict
 
-import copy
-from collections import OrderedDict
+from collections import Counter, defaultdict, OrderedDict
 from dataclasses import dataclass, field
 from typing import (
     Any,
@@ -131,6 +130,27 @@ def replace_placement_with_meta_device(
             )
 
 
+# sharding type -> (pooled sharding class, whether it takes permute_embeddings),
+# DATA_PARALLEL is constructed separately as it takes no qcomm codecs
+_SHARDING_TYPE_TO_POOLED_EMBEDDING_SHARDING: Dict[
+    str,
+    Tuple[
+        Type[
+            EmbeddingSharding[
+                EmbeddingShardingContext, KeyedJaggedTensor, torch.Tensor, torch.Tensor
+            ]
+        ],
+        bool,
+    ],
+] = {
+    ShardingType.TABLE_WISE.value: (TwPooledEmbeddingSharding, False),
+    ShardingType.ROW_WISE.value: (RwPooledEmbeddingSharding, False),
+    ShardingType.TABLE_ROW_WISE.value: (TwRwPooledEmbeddingSharding, False),
+    ShardingType.COLUMN_WISE.value: (CwPooledEmbeddingSharding, True),
+    ShardingType.TABLE_COLUMN_WISE.value: (TwCwPooledEmbeddingSharding, True),
+}
+
+
 def create_embedding_bag_sharding(
     sharding_type: str,
     sharding_infos: List[EmbeddingShardingInfo],
@@ -143,47 +163,51 @@ def create_embedding_bag_sharding(
 ]:
     if device is not None and device.type == "meta":
         replace_placement_with_meta_device(sharding_infos)
-    if sharding_type == ShardingType.TABLE_WISE.value:
-        return TwPooledEmbeddingSharding(
-            sharding_infos,
-            env,
-            device,
-            qcomm_codecs_registry=qcomm_codecs_registry,
-        )
-    elif sharding_type == ShardingType.ROW_WISE.value:
-        return RwPooledEmbeddingSharding(
-            sharding_infos,
-            env,
-            device,
-            qcomm_codecs_registry=qcomm_codecs_registry,
-        )
-    elif sharding_type == ShardingType.DATA_PARALLEL.value:
+    if sharding_type == ShardingType.DATA_PARALLEL.value:
         return DpPooledEmbeddingSharding(sharding_infos, env, device)
-    elif sharding_type == ShardingType.TABLE_ROW_WISE.value:
-        return TwRwPooledEmbeddingSharding(
-            sharding_infos,
-            env,
-            device,
-            qcomm_codecs_registry=qcomm_codecs_registry,
-        )
-    elif sharding_type == ShardingType.COLUMN_WISE.value:
-        return CwPooledEmbeddingSharding(
-            sharding_infos,
-            env,
-            device,
-            permute_embeddings=permute_embeddings,
-            qcomm_codecs_registry=qcomm_codecs_registry,
-        )
-    elif sharding_type == ShardingType.TABLE_COLUMN_WISE.value:
-        return TwCwPooledEmbeddingSharding(
+    if sharding_type not in _SHARDING_TYPE_TO_POOLED_EMBEDDING_SHARDING:
+        raise ValueError(f"Sharding type not supported {sharding_type}")
+
+    sharding_cls, supports_permute_embeddings = (
+        _SHARDING_TYPE_TO_POOLED_EMBEDDING_SHARDING[sharding_type]
+    )
+    if supports_permute_embeddings:
+        # pyre-ignore [28]
+        return sharding_cls(
             sharding_infos,
             env,
             device,
             permute_embeddings=permute_embeddings,
             qcomm_codecs_registry=qcomm_codecs_registry,
         )
-    else:
-        raise ValueError(f"Sharding type not supported {sharding_type}")
+    # pyre-ignore [28]
+    return sharding_cls(
+        sharding_infos,
+        env,
+        device,
+        qcomm_codecs_registry=qcomm_codecs_registry,
+    )
+
+
+def _create_embedding_table_config(
+    config: EmbeddingBagConfig,
+    embedding_names: List[str],
+    is_weighted: bool,
+) -> EmbeddingTableConfig:
+    return EmbeddingTableConfig(
+        num_embeddings=config.num_embeddings,
+        embedding_dim=config.embedding_dim,
+        name=config.name,
+        data_type=config.data_type,
+        feature_names=list(config.feature_names),
+        pooling=config.pooling,
+        is_weighted=is_weighted,
+        has_feature_processor=False,
+        embedding_names=embedding_names,
+        weight_init_max=config.weight_init_max,
+        weight_init_min=config.weight_init_min,
+        pruning_indices_remapping=config.pruning_indices_remapping,
+    )
 
 
 def create_sharding_infos_by_sharding(
@@ -197,24 +221,32 @@ def create_sharding_infos_by_sharding(
     if fused_params is None:
         fused_params = {}
 
-    shared_feature: Dict[str, bool] = {}
-    for embedding_config in module.embedding_bag_configs():
+    embedding_bag_configs = module.embedding_bag_configs()
+    for embedding_config in embedding_bag_configs:
         if not embedding_config.feature_names:
             embedding_config.feature_names = [embedding_config.name]
-        for feature_name in embedding_config.feature_names:
-            if feature_name not in shared_feature:
-                shared_feature[feature_name] = False
-            else:
-                shared_feature[feature_name] = True
+    feature_counts = Counter(
+        feature_name
+        for embedding_config in embedding_bag_configs
+        for feature_name in embedding_config.feature_names
+    )
+    shared_feature: Dict[str, bool] = {
+        feature_name: count > 1 for feature_name, count in feature_counts.items()
+    }
 
-    sharding_type_to_sharding_infos: Dict[str, List[EmbeddingShardingInfo]] = {}
+    sharding_type_to_sharding_infos: Dict[str, List[EmbeddingShardingInfo]] = (
+        defaultdict(list)
+    )
+
+    is_weighted = module.is_weighted()
 
     # state_dict returns parameter.Tensor, which loses parameter level attributes
     parameter_by_name = dict(module.named_parameters())
-    # QuantEBC registers weights as buffers (since they are INT8), and so we need to grab it there
-    state_dict = module.state_dict()
+    # QuantEBC registers weights as buffers (since they are INT8), and so we need to grab it there,
+    # only materialized on the first table whose weight is not a parameter
+    state_dict: Optional[Dict[str, Any]] = None
 
-    for config in module.embedding_bag_configs():
+    for config in embedding_bag_configs:
         table_name = config.name
         assert (
             table_name in table_name_to_parameter_sharding
@@ -237,11 +269,12 @@ def create_sharding_infos_by_sharding(
         if suffix is not None:
             param_name = f"{param_name}.{suffix}"
 
-        assert param_name in parameter_by_name or param_name in state_dict
-        param = parameter_by_name.get(param_name, state_dict[param_name])
-
-        if parameter_sharding.sharding_type not in sharding_type_to_sharding_infos:
-            sharding_type_to_sharding_infos[parameter_sharding.sharding_type] = []
+        param = parameter_by_name.get(param_name)
+        if param is None:
+            if state_dict is None:
+                state_dict = module.state_dict()
+            assert param_name in state_dict
+            param = state_dict[param_name]
 
         optimizer_params = getattr(param, "_optimizer_kwargs", [{}])
         optimizer_classes = getattr(param, "_optimizer_classes", [None])
@@ -266,26 +299,15 @@ def create_sharding_infos_by_sharding(
 
         sharding_type_to_sharding_infos[parameter_sharding.sharding_type].append(
             EmbeddingShardingInfo(
-                embedding_config=EmbeddingTableConfig(
-                    num_embeddings=config.num_embeddings,
-                    embedding_dim=config.embedding_dim,
-                    name=config.name,
-                    data_type=config.data_type,
-                    feature_names=copy.deepcopy(config.feature_names),
-                    pooling=config.pooling,
-                    is_weighted=module.is_weighted(),
-                    has_feature_processor=False,
-                    embedding_names=embedding_names,
-                    weight_init_max=config.weight_init_max,
-                    weight_init_min=config.weight_init_min,
-                    pruning_indices_remapping=config.pruning_indices_remapping,
+                embedding_config=_create_embedding_table_config(
+                    config, embedding_names, is_weighted
                 ),
                 param_sharding=parameter_sharding,
                 param=param,
                 fused_params=per_table_fused_params,
             )
         )
-    return sharding_type_to_sharding_infos
+    return dict(sharding_type_to_sharding_infos)
 
 
 def construct_output_kt(
@@ -311,12 +333,12 @@ class VariableBatchEmbeddingBagCollectionAwaitable(LazyAwaitable[KeyedTensor]):
         self,
         awaitables: List[Awaitable[torch.Tensor]],
         inverse_indices: Tuple[List[str], torch.Tensor],
-        inverse_indices_permute_indices: torch.Tensor,
+        inverse_indices_permute_indices: Optional[torch.Tensor],
         batch_size_per_feature_pre_a2a: List[int],
         uncombined_embedding_dims: List[int],
         embedding_names: List[str],
         embedding_dims: List[int],
-        permute_op: PermutePooledEmbeddings,
+        permute_op: Optional[PermutePooledEmbeddings],
     ) -> None:
         super().__init__()
         self._awaitables = awaitables
@@ -331,8 +353,13 @@ class VariableBatchEmbeddingBagCollectionAwaitable(LazyAwaitable[KeyedTensor]):
     def _wait_impl(self) -> KeyedTensor:
         embeddings = [w.wait() for w in self._awaitables]
         batch_size = self._inverse_indices[1].numel() // len(self._inverse_indices[0])
-        indices = torch.index_select(
-            self._inverse_indices[1], 0, self._inverse_indices_permute_indices
+        # None permute indices / permute op mean the permutation is identity
+        indices = (
+            self._inverse_indices[1]
+            if self._inverse_indices_permute_indices is None
+            else torch.index_select(
+                self._inverse_indices[1], 0, self._inverse_indices_permute_indices
+            )
         )
         reindex_output = torch.ops.fbgemm.batch_index_select_dim0(
             inputs=embeddings[0] if len(embeddings) == 1 else torch.cat(embeddings),
@@ -343,7 +370,13 @@ class VariableBatchEmbeddingBagCollectionAwaitable(LazyAwaitable[KeyedTensor]):
             permute_output_dim_0_1=True,
         ).view(batch_size, -1)
         return construct_output_kt(
-            embeddings=[self._permute_op(reindex_output)],
+            embeddings=[
+                (
+                    reindex_output
+                    if self._permute_op is None
+                    else self._permute_op(reindex_output)
+                )
+            ],
             embedding_names=self._embedding_names,
             embedding_dims=self._embedding_dims,
         )
@@ -410,7 +443,8 @@ class ShardedEmbeddingBagCollection(
         qcomm_codecs_registry: Optional[Dict[str, QuantizedCommCodecs]] = None,
     ) -> None:
         super().__init__(qcomm_codecs_registry=qcomm_codecs_registry)
-        self._embedding_bag_configs: List[EmbeddingBagConfig] = (
+        # read-only after construction
+        self._embedding_bag_configs: Tuple[EmbeddingBagConfig, ...] = tuple(
             module.embedding_bag_configs()
         )
         self._table_names: List[str] = [
@@ -470,6 +504,7 @@ class ShardedEmbeddingBagCollection(
         self._uncombined_embedding_names: List[str] = []
         self._uncombined_embedding_dims: List[int] = []
         self._inverse_indices_permute_indices: Optional[torch.Tensor] = None
+        self._inverse_indices_permute_is_identity: bool = False
         # to support the FP16 hook
         self._create_output_dist()
 
@@ -510,6 +545,12 @@ class ShardedEmbeddingBagCollection(
                     broadcast_buffers=True,
                     static_graph=True,
                 )
+        # lookups with any DDP wrapping removed, for the state dict hooks
+        self._unwrapped_lookups: List[nn.Module] = []
+        for lookup in self._lookups:
+            while isinstance(lookup, DistributedDataParallel):
+                lookup = lookup.module
+            self._unwrapped_lookups.append(lookup)
         self._initialize_torch_state()
 
         # TODO[zainhuda]: support module device coming from CPU
@@ -525,9 +566,7 @@ class ShardedEmbeddingBagCollection(
         prefix: str = "",
         keep_vars: bool = False,
     ) -> None:
-        for lookup in self._lookups:
-            while isinstance(lookup, DistributedDataParallel):
-                lookup = lookup.module
+        for lookup in self._unwrapped_lookups:
             lookup.flush()
 
     @staticmethod
@@ -556,9 +595,12 @@ class ShardedEmbeddingBagCollection(
                     dim = state_dict[key].metadata().shards_metadata[0].shard_sizes[1]
                     # CW multiple shards are merged
                     if len(local_shards) > 1:
-                        state_dict[key] = torch.cat(
-                            [s.tensor.view(-1) for s in local_shards], dim=0
-                        ).view(-1, dim)
+                        shard_tensors = [s.tensor for s in local_shards]
+                        if not all(
+                            t.dim() == 2 and t.size(1) == dim for t in shard_tensors
+                        ):
+                            shard_tensors = [t.view(-1, dim) for t in shard_tensors]
+                        state_dict[key] = torch.cat(shard_tensors, dim=0)
                     else:
                         state_dict[key] = local_shards[0].tensor.view(-1, dim)
             elif isinstance(state_dict[key], torch.Tensor):
@@ -586,9 +628,7 @@ class ShardedEmbeddingBagCollection(
                     f"Unexpected state_dict key type {type(state_dict[key])} found for {key}"
                 )
 
-        for lookup in self._lookups:
-            while isinstance(lookup, DistributedDataParallel):
-                lookup = lookup.module
+        for lookup in self._unwrapped_lookups:
             lookup.purge()
 
     def _initialize_torch_state(self) -> None:  # noqa
@@ -613,13 +653,6 @@ class ShardedEmbeddingBagCollection(
                 parameter_sharding.compute_kernel
             )
 
-        self._name_to_table_size = {}
-        for table in self._embedding_bag_configs:
-            self._name_to_table_size[table.name] = (
-                table.num_embeddings,
-                table.embedding_dim,
-            )
-
         for sharding_type, lookup in zip(
             self._sharding_type_to_sharding.keys(), self._lookups
         ):
@@ -655,10 +688,11 @@ class ShardedEmbeddingBagCollection(
                         EmptyFusedOptimizer()
                     ]
             # created ShardedTensors once in init, use in post_state_dict_hook
+            table_config = self._table_name_to_config[table_name]
             self._model_parallel_name_to_sharded_tensor[table_name] = (
                 ShardedTensor._init_from_local_shards(
                     local_shards,
-                    self._name_to_table_size[table_name],
+                    (table_config.num_embeddings, table_config.embedding_dim),
                     process_group=self._env.process_group,
                 )
             )
@@ -705,15 +739,23 @@ class ShardedEmbeddingBagCollection(
             feature_names.extend(sharding.feature_names())
             self._feature_splits.append(len(sharding.feature_names()))
 
-        if feature_names == input_feature_names:
+        features_order = [input_feature_names.index(f) for f in feature_names]
+        # split only reads the leading keys, so an identity prefix needs no permute
+        if features_order == list(range(len(features_order))):
             self._has_features_permute = False
         else:
-            for f in feature_names:
-                self._features_order.append(input_feature_names.index(f))
+            self._features_order.extend(features_order)
+            features_order_tensor = torch.tensor(
+                self._features_order, dtype=torch.int32
+            )
             self.register_buffer(
                 "_features_order_tensor",
-                torch.tensor(
-                    self._features_order, device=self._device, dtype=torch.int32
+                (
+                    features_order_tensor.to(device=self._device)
+                    if self._device is not None and self._device.type == "meta"
+                    else _pin_and_move(
+                        features_order_tensor, self._device or torch.device("cpu")
+                    )
                 ),
                 persistent=False,
             )
@@ -739,22 +781,27 @@ class ShardedEmbeddingBagCollection(
             meta.shard_offsets[1] if meta is not None else 0
             for meta in embedding_shard_metadata
         ]
+        uncombined_embedding_names = self._uncombined_embedding_names
         embedding_name_order: Dict[str, int] = {}
-        for i, name in enumerate(self._uncombined_embedding_names):
+        for i, name in enumerate(uncombined_embedding_names):
             embedding_name_order.setdefault(name, i)
 
-        def sort_key(input: Tuple[int, str]) -> Tuple[int, int]:
-            index, name = input
-            return (embedding_name_order[name], embedding_shard_offsets[index])
-
-        permute_indices = [
-            i
-            for i, _ in sorted(
-                enumerate(self._uncombined_embedding_names), key=sort_key
+        # build the (name order, shard offset) sort keys column-wise in one pass,
+        # then argsort by indexing into them
+        sort_keys: List[Tuple[int, int]] = list(
+            zip(
+                [embedding_name_order[name] for name in uncombined_embedding_names],
+                embedding_shard_offsets,
+            )
+        )
+        permute_indices = sorted(range(len(sort_keys)), key=sort_keys.__getitem__)
+        # no permute op needed when uncombined embeddings are already in order
+        self._permute_op: Optional[PermutePooledEmbeddings] = (
+            None
+            if permute_indices == list(range(len(permute_indices)))
+            else PermutePooledEmbeddings(
+                self._uncombined_embedding_dims, permute_indices, self._device
             )
-        ]
-        self._permute_op: PermutePooledEmbeddings = PermutePooledEmbeddings(
-            self._uncombined_embedding_dims, permute_indices, self._device
         )
 
     def _create_inverse_indices_permute_indices(
@@ -768,6 +815,9 @@ class ShardedEmbeddingBagCollection(
             index_per_name[name.split("@")[0]]
             for name in self._uncombined_embedding_names
         ]
+        self._inverse_indices_permute_is_identity = permute_indices == list(
+            range(len(inverse_indices[0]))
+        )
         self._inverse_indices_permute_indices = _pin_and_move(
             torch.tensor(permute_indices),
             inverse_indices[1].device,
@@ -780,12 +830,10 @@ class ShardedEmbeddingBagCollection(
         if self._has_uninitialized_input_dist:
             self._create_input_dist(features.keys())
             self._has_uninitialized_input_dist = False
-        ctx.variable_batch_per_feature = features.variable_stride_per_key()
+        variable_batch_per_feature = features.variable_stride_per_key()
+        ctx.variable_batch_per_feature = variable_batch_per_feature
         ctx.inverse_indices = features.inverse_indices_or_none()
-        if (
-            ctx.variable_batch_per_feature
-            and self._inverse_indices_permute_indices is None
-        ):
+        if variable_batch_per_feature and self._inverse_indices_permute_indices is None:
             self._create_inverse_indices_permute_indices(ctx.inverse_indices)
         with torch.no_grad():
             if self._has_features_permute:
@@ -804,7 +852,8 @@ class ShardedEmbeddingBagCollection(
                 ctx.sharding_contexts.append(
                     EmbeddingShardingContext(
                         batch_size_per_feature_pre_a2a=features_by_shard.stride_per_key(),
-                        variable_batch_per_feature=features_by_shard.variable_stride_per_key(),
+                        # permute and split keep variable stride of the input KJT
+                        variable_batch_per_feature=variable_batch_per_feature,
                     )
                 )
             return KJTListSplitsAwaitable(awaitables, ctx)
@@ -821,7 +870,6 @@ class ShardedEmbeddingBagCollection(
         ctx: EmbeddingBagCollectionContext,
         output: List[torch.Tensor],
     ) -> LazyAwaitable[KeyedTensor]:
-        batch_size_per_feature_pre_a2a = []
         awaitables = []
         for dist, sharding_context, embeddings in zip(
             self._output_dists,
@@ -829,19 +877,26 @@ class ShardedEmbeddingBagCollection(
             output,
         ):
             awaitables.append(dist(embeddings, sharding_context))
-            if sharding_context:
-                batch_size_per_feature_pre_a2a.extend(
-                    sharding_context.batch_size_per_feature_pre_a2a
-                )
 
         if ctx.variable_batch_per_feature:
             assert (
                 ctx.inverse_indices is not None
             ), "inverse indices must be provided from KJT if using variable batch size per feature."
+            # only the variable batch path reads the pre-a2a batch sizes
+            batch_size_per_feature_pre_a2a = [
+                batch_size
+                for sharding_context in ctx.sharding_contexts
+                if sharding_context
+                for batch_size in sharding_context.batch_size_per_feature_pre_a2a
+            ]
             return VariableBatchEmbeddingBagCollectionAwaitable(
                 awaitables=awaitables,
                 inverse_indices=ctx.inverse_indices,
-                inverse_indices_permute_indices=self._inverse_indices_permute_indices,
+                inverse_indices_permute_indices=(
+                    None
+                    if self._inverse_indices_permute_is_identity
+                    else self._inverse_indices_permute_indices
+                ),
                 batch_size_per_feature_pre_a2a=batch_size_per_feature_pre_a2a,
                 uncombined_embedding_dims=self._uncombined_embedding_dims,
                 embedding_names=self._embedding_names,
@@ -858,7 +913,6 @@ class ShardedEmbeddingBagCollection(
     def compute_and_output_dist(
         self, ctx: EmbeddingBagCollectionContext, input: KJTList
     ) -> LazyAwaitable[KeyedTensor]:
-        batch_size_per_feature_pre_a2a = []
         awaitables = []
 
         # No usage of zip for dynamo
@@ -868,19 +922,26 @@ class ShardedEmbeddingBagCollection(
             sharding_context = ctx.sharding_contexts[i]
             features = input[i]
             awaitables.append(dist(lookup(features), sharding_context))
-            if sharding_context:
-                batch_size_per_feature_pre_a2a.extend(
-                    sharding_context.batch_size_per_feature_pre_a2a
-                )
 
         if ctx.variable_batch_per_feature:
             assert (
                 ctx.inverse_indices is not None
             ), "inverse indices must be provided from KJT if using variable batch size per feature."
+            # only the variable batch path reads the pre-a2a batch sizes
+            batch_size_per_feature_pre_a2a = [
+                batch_size
+                for sharding_context in ctx.sharding_contexts
+                if sharding_context
+                for batch_size in sharding_context.batch_size_per_feature_pre_a2a
+            ]
             return VariableBatchEmbeddingBagCollectionAwaitable(
                 awaitables=awaitables,
                 inverse_indices=ctx.inverse_indices,
-                inverse_indices_permute_indices=self._inverse_indices_permute_indices,
+                inverse_indices_permute_indices=(
+                    None
+                    if self._inverse_indices_permute_is_identity
+                    else self._inverse_indices_permute_indices
+                ),
                 batch_size_per_feature_pre_a2a=batch_size_per_feature_pre_a2a,
                 uncombined_embedding_dims=self._uncombined_embedding_dims,
                 embedding_names=self._embedding_names,
@@ -945,8 +1006,7 @@ class EmbeddingAwaitable(LazyAwaitable[torch.Tensor]):
         self._awaitable = awaitable
 
     def _wait_impl(self) -> torch.Tensor:
-        embedding = self._awaitable.wait()
-        return embedding
+        return self._awaitable.wait()
 
 
 class ShardedEmbeddingBag(
@@ -1031,6 +1091,33 @@ class ShardedEmbeddingBag(
                 module.fused_optimizer.params = params
                 optims.append(("", module.fused_optimizer))
         self._optim: CombinedOptimizer = CombinedOptimizer(optims)
+        # parameter names are fixed once the lookup is built
+        self._sharded_parameter_names: List[str] = (
+            []
+            if self.parameter_sharding.sharding_type == ShardingType.DATA_PARALLEL.value
+            else [
+                name.rsplit(".", 1)[-1] for name, _ in self._lookup.named_parameters("")
+            ]
+        )
+        # all-one weights shared across forwards, sliced to the input size
+        self._unit_per_sample_weights: Optional[torch.Tensor] = None
+
+    def _get_unit_per_sample_weights(self, input: Tensor) -> Tensor:
+        numel = input.numel()
+        unit_weights = self._unit_per_sample_weights
+        if unit_weights is None or unit_weights.device != input.device:
+            unit_weights = torch.ones(numel, dtype=torch.float, device=input.device)
+            self._unit_per_sample_weights = unit_weights
+        elif unit_weights.numel() < numel:
+            # grow geometrically so that a slowly increasing input size does
+            # not reallocate every step
+            unit_weights = torch.ones(
+                max(numel, 2 * unit_weights.numel()),
+                dtype=torch.float,
+                device=input.device,
+            )
+            self._unit_per_sample_weights = unit_weights
+        return unit_weights[:numel].view_as(input)
 
     # pyre-ignore [14]
     def input_dist(
@@ -1041,7 +1128,7 @@ class ShardedEmbeddingBag(
         per_sample_weights: Optional[Tensor] = None,
     ) -> Awaitable[Awaitable[KeyedJaggedTensor]]:
         if per_sample_weights is None:
-            per_sample_weights = torch.ones_like(input, dtype=torch.float)
+            per_sample_weights = self._get_unit_per_sample_weights(input)
         features = KeyedJaggedTensor(
             keys=[self._dummy_feature_name],
             values=input,
@@ -1076,9 +1163,10 @@ class ShardedEmbeddingBag(
         # pyre-fixme[19]: Expected 0 positional arguments.
         lookup_state_dict = self._lookup.state_dict(None, "", keep_vars)
         # update key to match embeddingBag state_dict key
-        for key, item in lookup_state_dict.items():
-            new_key = prefix + key.split(".")[-1]
-            destination[new_key] = item
+        destination.update(
+            (prefix + key.rsplit(".", 1)[-1], item)
+            for key, item in lookup_state_dict.items()
+        )
         return destination
 
     def named_modules(
@@ -1095,21 +1183,18 @@ class ShardedEmbeddingBag(
         # TODO: add remove_duplicate
         for name, parameter in self._lookup.named_parameters("", recurse):
             # update name to match embeddingBag parameter name
-            yield append_prefix(prefix, name.split(".")[-1]), parameter
+            yield append_prefix(prefix, name.rsplit(".", 1)[-1]), parameter
 
     def sharded_parameter_names(self, prefix: str = "") -> Iterator[str]:
-        if self.parameter_sharding.sharding_type == ShardingType.DATA_PARALLEL.value:
-            yield from []
-        else:
-            for name, _ in self._lookup.named_parameters(""):
-                yield append_prefix(prefix, name.split(".")[-1])
+        for name in self._sharded_parameter_names:
+            yield append_prefix(prefix, name)
 
     def named_buffers(
         self, prefix: str = "", recurse: bool = True, remove_duplicate: bool = True
     ) -> Iterator[Tuple[str, torch.Tensor]]:
         # TODO: add remove_duplicate
         for name, buffer in self._lookup.named_buffers("", recurse):
-            yield append_prefix(prefix, name.split(".")[-1]), buffer
+            yield append_prefix(prefix, name.rsplit(".", 1)[-1]), buffer
 
     # pyre-fixme[14]: `load_state_dict` overrides method defined in `Module`
     #  inconsistently.
@@ -1118,22 +1203,14 @@ class ShardedEmbeddingBag(
         state_dict: "OrderedDict[str, torch.Tensor]",
         strict: bool = True,
     ) -> _IncompatibleKeys:
-        missing_keys = []
-        unexpected_keys = []
-        # update key to match  embeddingBag state_dict key
-        for key, value in state_dict.items():
-            new_key = ".".join([self._dummy_embedding_table_name, key])
-            state_dict[new_key] = value
-            state_dict.pop(key)
+        # update key to match lookup state_dict key, without mutating the input
+        key_prefix = self._dummy_embedding_table_name + "."
         missing, unexpected = self._lookup.load_state_dict(
-            state_dict,
+            OrderedDict((key_prefix + key, value) for key, value in state_dict.items()),
             strict,
         )
-        missing_keys.extend(missing)
-        unexpected_keys.extend(unexpected)
-
         return _IncompatibleKeys(
-            missing_keys=missing_keys, unexpected_keys=unexpected_keys
+            missing_keys=list(missing), unexpected_keys=list(unexpected)
         )
 
     @property
@@ -91,7 +91,7 @@ class InferHeteroShardingsTest(unittest.TestCase):
             env=env_dict,
         )
         self.assertTrue(hasattr(sharded_model._module_kjt_input[0], "_lookups"))
-        self.assertTrue(len(sharded_model._module_kjt_input[0]._lookups) == 2)
+        self.assertEqual(len(sharded_model._module_kjt_input[0]._lookups), 2)
         for i, env in enumerate(env_dict.values()):
             self.assertTrue(
                 hasattr(
@@ -99,11 +99,11 @@ class InferHeteroShardingsTest(unittest.TestCase):
                     "_embedding_lookups_per_rank",
                 )
             )
-            self.assertTrue(
+            self.assertEqual(
                 len(
                     sharded_model._module_kjt_input[0]
                     ._lookups[i]
                     ._embedding_lookups_per_rank
-                )
-                == env.world_size
+                ),
+                env.world_size,
             )
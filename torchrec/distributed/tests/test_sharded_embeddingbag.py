@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import torch
+import torch.nn as nn
+from torch.distributed._shard.sharded_tensor import ShardedTensor
+from torchrec.distributed.embeddingbag import (
+    EmbeddingBagCollectionSharder,
+    EmbeddingBagSharder,
+    ShardedEmbeddingBag,
+    ShardedEmbeddingBagCollection,
+)
+from torchrec.distributed.sharding_plan import (
+    column_wise,
+    construct_module_sharding_plan,
+    ParameterShardingGenerator,
+    table_wise,
+)
+from torchrec.distributed.test_utils.multi_process import (
+    MultiProcessContext,
+    MultiProcessTestBase,
+)
+from torchrec.distributed.types import ShardingEnv
+from torchrec.modules.embedding_configs import EmbeddingBagConfig
+from torchrec.modules.embedding_modules import EmbeddingBagCollection
+from torchrec.sparse.jagged_tensor import KeyedJaggedTensor
+from torchrec.test_utils import skip_if_asan_class
+
+
+def _local_tensor(value: torch.Tensor) -> torch.Tensor:
+    if isinstance(value, ShardedTensor):
+        return value.local_shards()[0].tensor
+    return value
+
+
+def _test_sharded_embedding_bag_load_state_dict(
+    rank: int,
+    world_size: int,
+    backend: str,
+    local_size: Optional[int] = None,
+) -> None:
+    with MultiProcessContext(rank, world_size, backend, local_size) as ctx:
+        device = torch.device("cpu")
+        sharder = EmbeddingBagSharder()
+        # pyre-fixme[6]: For 1st argument expected `ProcessGroup` but got
+        #  `Optional[ProcessGroup]`.
+        env = ShardingEnv.from_process_group(ctx.pg)
+
+        sharded_modules = []
+        for _ in range(2):
+            module = nn.EmbeddingBag(num_embeddings=10, embedding_dim=8, mode="sum")
+            plan = construct_module_sharding_plan(
+                module,
+                per_param_sharding={"weight": column_wise(ranks=[0])},
+                # pyre-ignore
+                sharder=sharder,
+                local_size=world_size,
+                world_size=world_size,
+                device_type=device.type,
+            )
+            sharded_module = sharder.shard(module, plan, env, device)
+            assert isinstance(sharded_module, ShardedEmbeddingBag)
+            sharded_modules.append(sharded_module)
+        src_module, dst_module = sharded_modules
+
+        state_dict = src_module.state_dict()
+        state_dict_before_load = OrderedDict(state_dict)
+        incompatible_keys = dst_module.load_state_dict(state_dict)
+
+        assert incompatible_keys.missing_keys == []
+        assert incompatible_keys.unexpected_keys == []
+        # the caller's state dict is left untouched
+        assert list(state_dict.keys()) == list(state_dict_before_load.keys())
+        for key, value in state_dict_before_load.items():
+            assert state_dict[key] is value
+        # and the weights are loaded
+        dst_state_dict = dst_module.state_dict()
+        assert list(dst_state_dict.keys()) == list(state_dict.keys())
+        for key, value in state_dict.items():
+            torch.testing.assert_close(
+                _local_tensor(dst_state_dict[key]), _local_tensor(value)
+            )
+
+
+def _test_sharded_ebc_feature_orders(
+    rank: int,
+    world_size: int,
+    mixed_sharding: bool,
+    backend: str,
+    local_size: Optional[int] = None,
+) -> None:
+    with MultiProcessContext(rank, world_size, backend, local_size) as ctx:
+        device = torch.device("cpu")
+        sharder = EmbeddingBagCollectionSharder()
+        # pyre-fixme[6]: For 1st argument expected `ProcessGroup` but got
+        #  `Optional[ProcessGroup]`.
+        env = ShardingEnv.from_process_group(ctx.pg)
+        tables = [
+            EmbeddingBagConfig(
+                name=f"table_{i}",
+                feature_names=[f"feature_{i}"],
+                embedding_dim=8,
+                num_embeddings=10,
+            )
+            for i in range(3)
+        ]
+        # sharding types are laid out in order of first appearance, so mixing
+        # column-wise and table-wise tables reorders the sharded features and
+        # the output embeddings
+        if mixed_sharding:
+            per_param_sharding: Dict[str, ParameterShardingGenerator] = {
+                "table_0": column_wise(ranks=[0]),
+                "table_1": table_wise(rank=0),
+                "table_2": column_wise(ranks=[0]),
+            }
+            sharded_feature_order = ["feature_0", "feature_2", "feature_1"]
+        else:
+            per_param_sharding = {
+                "table_0": table_wise(rank=0),
+                "table_1": table_wise(rank=0),
+                "table_2": table_wise(rank=0),
+            }
+            sharded_feature_order = ["feature_0", "feature_1", "feature_2"]
+
+        # (input keys, whether input_dist has to permute the features)
+        input_keys_and_permutes: List[Tuple[List[str], bool]] = [
+            (["feature_0", "feature_1", "feature_2"], mixed_sharding),
+            # sharded order followed by a feature no table reads
+            (sharded_feature_order + ["feature_3"], False),
+            (["feature_2", "feature_1", "feature_0"], True),
+        ]
+        for input_keys, has_features_permute in input_keys_and_permutes:
+            module = EmbeddingBagCollection(tables=tables, device=device)
+            plan = construct_module_sharding_plan(
+                module,
+                per_param_sharding=per_param_sharding,
+                # pyre-ignore
+                sharder=sharder,
+                local_size=world_size,
+                world_size=world_size,
+                device_type=device.type,
+            )
+            sharded_module = sharder.shard(module, plan, env, device)
+            assert isinstance(sharded_module, ShardedEmbeddingBagCollection)
+
+            reference_module = EmbeddingBagCollection(tables=tables, device=device)
+            sharded_state_dict = sharded_module.state_dict()
+            with torch.no_grad():
+                for key, param in reference_module.named_parameters():
+                    param.copy_(_local_tensor(sharded_state_dict[key]))
+
+            features = KeyedJaggedTensor.from_lengths_sync(
+                keys=input_keys,
+                values=torch.arange(3 * len(input_keys)) % 10,
+                lengths=torch.tensor([1, 2] * len(input_keys)),
+            )
+            sharded_output = sharded_module(features).wait()
+            reference_output = reference_module(features)
+
+            assert sharded_module._has_features_permute == has_features_permute
+            assert (sharded_module._permute_op is not None) == mixed_sharding
+            assert sharded_output.keys() == reference_output.keys()
+            torch.testing.assert_close(
+                sharded_output.values(), reference_output.values()
+            )
+
+        # inverse indices come in the unsharded embedding order
+        sharded_module._create_inverse_indices_permute_indices(
+            (
+                ["feature_0", "feature_1", "feature_2"],
+                torch.zeros(3, 2, dtype=torch.int64),
+            )
+        )
+        assert sharded_module._inverse_indices_permute_is_identity != mixed_sharding
+        assert sharded_module._inverse_indices_permute_indices.tolist() == (
+            [0, 2, 1] if mixed_sharding else [0, 1, 2]
+        )
+
+
+@skip_if_asan_class
+class ShardedEmbeddingBagCollectionFeatureOrderTest(MultiProcessTestBase):
+    def test_table_wise_feature_orders(self) -> None:
+        self._run_multi_process_test(
+            callable=_test_sharded_ebc_feature_orders,
+            world_size=1,
+            mixed_sharding=False,
+            backend="gloo",
+        )
+
+    def test_mixed_sharding_feature_orders(self) -> None:
+        self._run_multi_process_test(
+            callable=_test_sharded_ebc_feature_orders,
+            world_size=1,
+            mixed_sharding=True,
+            backend="gloo",
+        )
+
+
+@skip_if_asan_class
+class ShardedEmbeddingBagTest(MultiProcessTestBase):
+    def test_load_state_dict(self) -> None:
+        self._run_multi_process_test(
+            callable=_test_sharded_embedding_bag_load_state_dict,
+            world_size=1,
+            backend="gloo",
+        )
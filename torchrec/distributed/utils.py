@@ -500,12 +500,22 @@ class PermutePooledEmbeddings:
             [0] + list(accumulate(inv_embs_dims)), device=device, dtype=torch.int64
         )
 
+    def _move_to(self, device: torch.device) -> None:
+        self._offset_dim_list = self._offset_dim_list.to(device=device)
+        self._permute = self._permute.to(device=device)
+        self._inv_offset_dim_list = self._inv_offset_dim_list.to(device=device)
+        self._inv_permute = self._inv_permute.to(device=device)
+
     def __call__(self, pooled_embs: torch.Tensor) -> torch.Tensor:
+        # move the permute metadata once instead of dispatching four .to() calls
+        # on every step
+        if self._permute.device != pooled_embs.device:
+            self._move_to(pooled_embs.device)
         result = torch.ops.fbgemm.permute_pooled_embs_auto_grad(
             pooled_embs,
-            self._offset_dim_list.to(device=pooled_embs.device),
-            self._permute.to(device=pooled_embs.device),
-            self._inv_offset_dim_list.to(device=pooled_embs.device),
-            self._inv_permute.to(device=pooled_embs.device),
+            self._offset_dim_list,
+            self._permute,
+            self._inv_offset_dim_list,
+            self._inv_permute,
         )
         return result